@@ -15,6 +15,7 @@ ModuleUpdate.update()
 import Utils
 death_link = False
 item_num = 1
+non_alphanumeric_re = re.compile('[^A-Za-z0-9 ]+')
 
 logger = logging.getLogger("Client")
 
@@ -196,8 +197,8 @@ class KH1Context(CommonContext):
                     filename = "sent"
                     with open(os.path.join(self.game_communication_path, filename), 'w') as f:
                         f.write(
-                          re.sub('[^A-Za-z0-9 ]+', '',str(itemName))[:15] + "\n"
-                        + re.sub('[^A-Za-z0-9 ]+', '',str(recieverName))[:6] + "\n"
+                          non_alphanumeric_re.sub('',str(itemName))[:15] + "\n"
+                        + non_alphanumeric_re.sub('',str(recieverName))[:6] + "\n"
                         + str(itemCategory) + "\n"
                         + str(locationID))
                         f.close()
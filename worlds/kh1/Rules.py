@@ -2,20 +2,39 @@ from BaseClasses import CollectionState
 from worlds.generic.Rules import add_rule
 from math import ceil
 
-SINGLE_PUPPIES = ["Puppy " + str(i).rjust(2,"0") for i in range(1,100)]
-TRIPLE_PUPPIES = ["Puppies " + str(3*(i-1)+1).rjust(2, "0") + "-" + str(3*(i-1)+3).rjust(2, "0") for i in range(1,34)]
+SINGLE_PUPPIES = frozenset("Puppy " + str(i).rjust(2,"0") for i in range(1,100))
+TRIPLE_PUPPIES = frozenset("Puppies " + str(i).rjust(2, "0") + "-" + str(i+2).rjust(2, "0") for i in range(1,100,3))
 TORN_PAGES = ["Torn Page " + str(i) for i in range(1,6)]
 WORLDS =    ["Wonderland", "Olympus Coliseum", "Deep Jungle", "Agrabah",      "Monstro",      "Atlantica", "Halloween Town", "Neverland",  "Hollow Bastion", "End of the World"]
 KEYBLADES = ["Lady Luck",  "Olympia",          "Jungle King", "Three Wishes", "Wishing Star", "Crabclaw",  "Pumpkinhead",    "Fairy Harp", "Divine Rose",    "Oblivion"]
+WORLD_KEYBLADES = tuple(zip(WORLDS, KEYBLADES))
+ARTS =      frozenset({"Fire Arts", "Blizzard Arts", "Thunder Arts", "Cure Arts",
+                       "Gravity Arts", "Stop Arts", "Aero Arts"})
+SUMMONS =   frozenset({"Simba", "Bambi", "Genie", "Dumbo", "Mushu", "Tinker Bell"})
+WORLD_MAP_EXIT_NUM_WORLDS = {
+    "Wonderland":       2,
+    "Olympus Coliseum": 2,
+    "Deep Jungle":      2,
+    "Agrabah":          2,
+    "Monstro":          2,
+    "Atlantica":        2,
+    "Halloween Town":   2,
+    "Neverland":        3,
+    "Hollow Bastion":   5,
+}
 
 def has_x_worlds(state: CollectionState, player: int, num_of_worlds: int, keyblades_unlock_chests: bool) -> bool:
+    if num_of_worlds <= 0:
+        return True
     worlds_acquired = 0.0
-    for i in range(len(WORLDS)):
-        if state.has(WORLDS[i], player):
+    for world, keyblade in WORLD_KEYBLADES:
+        if state.has(world, player):
             worlds_acquired = worlds_acquired + 0.5
-        if (state.has(WORLDS[i], player) and (not keyblades_unlock_chests or state.has(KEYBLADES[i], player))) or (state.has(WORLDS[i], player) and WORLDS[i] == "Atlantica"):
-            worlds_acquired = worlds_acquired + 0.5
-    return worlds_acquired >= num_of_worlds
+            if not keyblades_unlock_chests or world == "Atlantica" or state.has(keyblade, player):
+                worlds_acquired = worlds_acquired + 0.5
+            if worlds_acquired >= num_of_worlds:
+                return True
+    return False
 
 def has_emblems(state: CollectionState, player: int, keyblades_unlock_chests: bool) -> bool:
     return state.has_all({
@@ -34,14 +53,20 @@ def has_puppies_triplets(state: CollectionState, player: int, puppies_required:
 def has_puppies_individual(state: CollectionState, player: int, puppies_required: int) -> bool:
     return state.has_from_list_unique(SINGLE_PUPPIES, player, puppies_required)
 
+HAS_PUPPIES = {
+    "full":       has_puppies_all,
+    "triplets":   has_puppies_triplets,
+    "individual": has_puppies_individual,
+}
+
 def has_torn_pages(state: CollectionState, player: int, pages_required: int) -> bool:
     return state.count_from_list_unique(TORN_PAGES, player) >= pages_required
 
 def has_all_arts(state: CollectionState, player: int) -> bool:
-    return state.has_all({"Fire Arts", "Blizzard Arts", "Thunder Arts", "Cure Arts", "Gravity Arts", "Stop Arts", "Aero Arts"}, player)
+    return state.has_all(ARTS, player)
 
 def has_all_summons(state: CollectionState, player: int) -> bool:
-    return state.has_all({"Simba", "Bambi", "Genie", "Dumbo", "Mushu", "Tinker Bell"}, player)
+    return state.has_all(SUMMONS, player)
 
 def has_all_magic_lvx(state: CollectionState, player: int, level) -> bool:
     return state.has_all_counts({
@@ -106,11 +131,7 @@ def set_rules(kh1world):
     final_rest_door_required_reports = kh1world.determine_reports_required_to_open_final_rest_door()
     final_rest_door_requirement      = kh1world.options.final_rest_door.current_key
     
-    has_puppies = has_puppies_individual
-    if kh1world.options.puppies == "triplets":
-        has_puppies = has_puppies_triplets
-    elif kh1world.options.puppies == "full":
-        has_puppies = has_puppies_all
+    has_puppies = HAS_PUPPIES[kh1world.options.puppies.current_key]
     
     add_rule(kh1world.get_location("Traverse Town 1st District Candle Puzzle Chest"),
         lambda state: state.has("Progressive Blizzard", player))
@@ -1489,11 +1510,15 @@ def set_rules(kh1world):
                 has_emblems(state, player, options.keyblades_unlock_chests) and has_x_worlds(state, player, 7, options.keyblades_unlock_chests)
                 and has_defensive_tools(state, player)
             ))
+    # Levels only need a handful of distinct world counts, so share one rule per count
+    level_rules = {}
     for i in range(options.level_checks):
-        add_rule(kh1world.get_location("Level " + str(i+1).rjust(3,'0')),
-            lambda state, level_num=i: (
-                has_x_worlds(state, player, min(((level_num//10)*2), 8), options.keyblades_unlock_chests)
-            ))
+        num_of_worlds = min(((i//10)*2), 8)
+        if num_of_worlds not in level_rules:
+            level_rules[num_of_worlds] = lambda state, num_of_worlds=num_of_worlds: (
+                has_x_worlds(state, player, num_of_worlds, options.keyblades_unlock_chests)
+            )
+        add_rule(kh1world.get_location("Level " + str(i+1).rjust(3,'0')), level_rules[num_of_worlds])
     if options.goal.current_key == "final_ansem":
         add_rule(kh1world.get_location("Final Ansem"),
             lambda state: (
@@ -1931,25 +1956,14 @@ def set_rules(kh1world):
                 lambda state: state.has("Oathkeeper", player))
     
     
-    add_rule(kh1world.get_entrance("Wonderland"),
-        lambda state: state.has("Wonderland", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Olympus Coliseum"),
-        lambda state: state.has("Olympus Coliseum", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Deep Jungle"),
-        lambda state: state.has("Deep Jungle", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Agrabah"),
-        lambda state: state.has("Agrabah", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Monstro"),
-        lambda state: state.has("Monstro", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    if options.atlantica:
-        add_rule(kh1world.get_entrance("Atlantica"),
-            lambda state: state.has("Atlantica", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Halloween Town"),
-        lambda state: state.has("Halloween Town", player) and has_x_worlds(state, player, 2, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Neverland"),
-        lambda state: state.has("Neverland", player) and has_x_worlds(state, player, 3, options.keyblades_unlock_chests))
-    add_rule(kh1world.get_entrance("Hollow Bastion"),
-        lambda state: state.has("Hollow Bastion", player) and has_x_worlds(state, player, 5, options.keyblades_unlock_chests))
+    for world, num_of_worlds in WORLD_MAP_EXIT_NUM_WORLDS.items():
+        if world == "Atlantica" and not options.atlantica:
+            continue
+        add_rule(kh1world.get_entrance(world),
+            lambda state, world=world, num_of_worlds=num_of_worlds: (
+                state.has(world, player)
+                and has_x_worlds(state, player, num_of_worlds, options.keyblades_unlock_chests)
+            ))
     add_rule(kh1world.get_entrance("End of the World"),
         lambda state: has_x_worlds(state, player, 7, options.keyblades_unlock_chests) and (has_reports(state, player, eotw_required_reports) or state.has("End of the World", player)))
     add_rule(kh1world.get_entrance("100 Acre Wood"),
@@ -7,7 +7,7 @@ from .Items import KH1Item, KH1ItemData, event_item_table, get_items_by_category
 from .Locations import KH1Location, location_table, get_locations_by_category, location_name_groups
 from .Options import KH1Options, kh1_option_groups
 from .Regions import connect_entrances, create_regions
-from .Rules import set_rules
+from .Rules import set_rules, SINGLE_PUPPIES, TRIPLE_PUPPIES
 from .Presets import kh1_option_presets
 from worlds.LauncherComponents import Component, components, Type, launch_subprocess
 
@@ -120,9 +120,9 @@ class KH1World(World):
             if name in starting_worlds:
                 continue
             if data.category == "Puppies":
-                if self.options.puppies == "triplets" and "-" in name:
+                if self.options.puppies == "triplets" and name in TRIPLE_PUPPIES:
                     item_pool += [self.create_item(name) for _ in range(quantity)]
-                if self.options.puppies == "individual" and "Puppy" in name:
+                if self.options.puppies == "individual" and name in SINGLE_PUPPIES:
                     item_pool += [self.create_item(name) for _ in range(0, quantity)]
                 if self.options.puppies == "full" and name == "All Puppies":
                     item_pool += [self.create_item(name) for _ in range(0, quantity)]
@@ -253,8 +253,9 @@ class KH1World(World):
         new_report_settings = [self.options.required_reports_eotw.value, self.options.required_reports_door.value, self.options.reports_in_pool.value]
         for i in range(3):
             if initial_report_settings[i] != new_report_settings[i]:
-                logging.info(f"{self.player_name}'s value {initial_report_settings[i]} for \"{value_names[i]}\" was invalid\n"
-                             f"Setting \"{value_names[i]}\" value to {new_report_settings[i]}")
+                logging.info("%s's value %s for \"%s\" was invalid\nSetting \"%s\" value to %s",
+                             self.player_name, initial_report_settings[i], value_names[i],
+                             value_names[i], new_report_settings[i])
     
     def change_numbers_of_reports_to_consider(self) -> None:
         if self.options.end_of_the_world_unlock == "reports" and self.options.final_rest_door == "reports":
@@ -90,13 +90,18 @@ class LingoWorld(World):
             unreachable_locations = [location for location in all_locations
                                      if not state.can_reach_location(location.name, self.player)]
 
+            removed_locations = set()
             for location in unreachable_locations:
                 if location.name in self.player_logic.event_loc_to_item.keys():
                     continue
 
-                self.player_logic.real_locations.remove(location.name)
+                removed_locations.add(location.name)
                 location.parent_region.locations.remove(location)
 
+            if removed_locations:
+                self.player_logic.real_locations = [name for name in self.player_logic.real_locations
+                                                    if name not in removed_locations]
+
             if len(self.player_logic.real_items) > len(self.player_logic.real_locations):
                 raise OptionError(f"{self.player_name}'s Lingo world does not have enough locations to fit the number"
                                   f" of required items without shuffling the postgame. Either enable postgame"
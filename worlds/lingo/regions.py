@@ -5,7 +5,7 @@ from .datatypes import EntranceType, Room, RoomAndDoor
 from .items import LingoItem
 from .locations import LingoLocation
 from .options import SunwarpAccess
-from .rules import lingo_can_do_pilgrimage, lingo_can_use_entrance, make_location_lambda
+from .rules import lingo_can_do_pilgrimage, lingo_can_open_door, make_location_lambda
 from .static_logic import ALL_ROOMS, PAINTINGS
 
 if TYPE_CHECKING:
@@ -18,8 +18,8 @@ def create_region(room: Room, world: "LingoWorld") -> Region:
         new_location = LingoLocation(world.player, location.name, location.code, new_region)
         new_location.access_rule = make_location_lambda(location, world)
         new_region.locations.append(new_location)
-        if location.name in world.player_logic.event_loc_to_item:
-            event_name = world.player_logic.event_loc_to_item[location.name]
+        event_name = world.player_logic.event_loc_to_item.get(location.name)
+        if event_name is not None:
             event_item = LingoItem(event_name, ItemClassification.progression, None, world.player)
             new_location.place_locked_item(event_item)
 
@@ -41,13 +41,17 @@ def is_acceptable_pilgrimage_entrance(entrance_type: EntranceType, world: "Lingo
 def connect_entrance(regions: Dict[str, Region], source_region: Region, target_region: Region, description: str,
                      door: Optional[RoomAndDoor], entrance_type: EntranceType, pilgrimage: bool, world: "LingoWorld"):
     connection = Entrance(world.player, description, source_region)
-    connection.access_rule = lambda state: lingo_can_use_entrance(state, target_region.name, door, world)
 
     source_region.exits.append(connection)
     connection.connect(target_region)
 
     if door is not None:
+        # Resolve the door's room once here rather than on every access check. Doorless entrances keep the default
+        # always-true access rule.
         effective_room = target_region.name if door.room is None else door.room
+        connection.access_rule = \
+            lambda state, room=effective_room, door_name=door.door: lingo_can_open_door(state, room, door_name, world)
+
         if door.door not in world.player_logic.item_by_door.get(effective_room, {}):
             access_reqs = world.player_logic.calculate_door_requirements(effective_room, door.door, world)
             for region in access_reqs.rooms:
@@ -1,24 +1,20 @@
 from typing import TYPE_CHECKING
 
 from BaseClasses import CollectionState
-from .datatypes import RoomAndDoor
+from .items import ITEMS_BY_GROUP
 from .player_logic import AccessRequirements, PlayerLocation
 from .static_logic import PROGRESSIVE_DOORS_BY_ROOM, PROGRESSIVE_ITEMS
 
 if TYPE_CHECKING:
     from . import LingoWorld
 
-
-def lingo_can_use_entrance(state: CollectionState, room: str, door: RoomAndDoor, world: "LingoWorld"):
-    if door is None:
-        return True
-
-    effective_room = room if door.room is None else door.room
-    return _lingo_can_open_door(state, effective_room, door.door, world)
+# Panel colors are stored lowercase; map them to their item names once instead of capitalizing on every check.
+COLOR_ITEMS = {color.lower(): color for color in ITEMS_BY_GROUP["Colors"]}
+SUNWARP_DOORS = tuple(f"{i} Sunwarp" for i in range(1, 7))
 
 
 def lingo_can_do_pilgrimage(state: CollectionState, world: "LingoWorld"):
-    return all(_lingo_can_open_door(state, "Sunwarps", f"{i} Sunwarp", world) for i in range(1, 7))
+    return all(lingo_can_open_door(state, "Sunwarps", door, world) for door in SUNWARP_DOORS)
 
 
 def lingo_can_use_location(state: CollectionState, location: PlayerLocation, world: "LingoWorld"):
@@ -26,18 +22,21 @@ def lingo_can_use_location(state: CollectionState, location: PlayerLocation, wor
 
 
 def lingo_can_use_mastery_location(state: CollectionState, world: "LingoWorld"):
+    required_count = world.options.mastery_achievements.value
     satisfied_count = 0
     for access_req in world.player_logic.mastery_reqs:
+        if satisfied_count >= required_count:
+            return True
         if _lingo_can_satisfy_requirements(state, access_req, world):
             satisfied_count += 1
-    return satisfied_count >= world.options.mastery_achievements.value
+    return satisfied_count >= required_count
 
 
 def lingo_can_use_level_2_location(state: CollectionState, world: "LingoWorld"):
     counted_panels = 0
     state.update_reachable_regions(world.player)
     for region in state.reachable_regions[world.player]:
-        for access_req, panel_count in world.player_logic.counting_panel_reqs.get(region.name, []):
+        for access_req, panel_count in world.player_logic.counting_panel_reqs.get(region.name, ()):
             if _lingo_can_satisfy_requirements(state, access_req, world):
                 counted_panels += panel_count
         if counted_panels >= world.options.level_2_requirement.value - 1:
@@ -51,18 +50,18 @@ def _lingo_can_satisfy_requirements(state: CollectionState, access: AccessRequir
             return False
 
     for req_door in access.doors:
-        if not _lingo_can_open_door(state, req_door.room, req_door.door, world):
+        if not lingo_can_open_door(state, req_door.room, req_door.door, world):
             return False
 
     if len(access.colors) > 0 and world.options.shuffle_colors:
         for color in access.colors:
-            if not state.has(color.capitalize(), world.player):
+            if not state.has(COLOR_ITEMS[color], world.player):
                 return False
 
-    if not all(state.has(item, world.player) for item in access.items):
+    if not state.has_all(access.items, world.player):
         return False
 
-    if not all(state.has(item, world.player, index) for item, index in access.progression.items()):
+    if not state.has_all_counts(access.progression, world.player):
         return False
 
     if access.the_master and not lingo_can_use_mastery_location(state, world):
@@ -74,14 +73,14 @@ def _lingo_can_satisfy_requirements(state: CollectionState, access: AccessRequir
     return True
 
 
-def _lingo_can_open_door(state: CollectionState, room: str, door: str, world: "LingoWorld"):
+def lingo_can_open_door(state: CollectionState, room: str, door: str, world: "LingoWorld"):
     """
     Determines whether a door can be opened
     """
-    if door not in world.player_logic.item_by_door.get(room, {}):
+    item_name = world.player_logic.item_by_door.get(room, {}).get(door)
+    if item_name is None:
         return _lingo_can_satisfy_requirements(state, world.player_logic.door_reqs[room][door], world)
 
-    item_name = world.player_logic.item_by_door[room][door]
     if item_name in PROGRESSIVE_ITEMS:
         progression = PROGRESSIVE_DOORS_BY_ROOM[room][door]
         return state.has(item_name, world.player, progression.index)
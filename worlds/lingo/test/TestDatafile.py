@@ -1,6 +1,7 @@
 import os
 import unittest
 
+from ..rules import COLOR_ITEMS
 from ..static_logic import HASHES, PANELS_BY_ROOM
 from ..utils.pickle_static_data import hash_file
 
@@ -19,3 +20,9 @@ class TestDatafile(unittest.TestCase):
         # This panel is defined earlier in the file than the panel door, so we want to check that the panel door is
         # correctly applied.
         self.assertNotEqual(PANELS_BY_ROOM["Outside The Agreeable"]["FIVE (1)"].panel_door, None)
+
+    def test_panel_colors_are_items(self) -> None:
+        for room_name, panels in PANELS_BY_ROOM.items():
+            for panel_name, panel in panels.items():
+                for color in panel.colors:
+                    self.assertIn(color, COLOR_ITEMS, f"{room_name} - {panel_name} has unknown color {color}")
@@ -9,8 +9,8 @@ from worlds.AutoWorld import WebWorld, World
 from worlds.LauncherComponents import Component, Type, components
 from .client_setup import launch_game
 from .connections import CONNECTIONS, RANDOMIZED_CONNECTIONS, TRANSITIONS
-from .constants import ALL_ITEMS, ALWAYS_LOCATIONS, BOSS_LOCATIONS, FILLER, NOTES, PHOBEKINS, PROG_ITEMS, TRAPS, \
-    USEFUL_ITEMS
+from .constants import ALL_ITEMS, ALWAYS_LOCATIONS, BOSS_LOCATIONS, FILLER, NOTES, PHOBEKINS, PROG_ITEMS, \
+    TIME_SHARDS, TRAPS, USEFUL_ITEMS
 from .options import AvailablePortals, Goal, Logic, MessengerOptions, NotesNeeded, ShuffleTransitions
 from .portals import PORTALS, add_closed_portal_reqs, disconnect_portals, shuffle_portals, validate_portals
 from .regions import LEVELS, MEGA_SHARDS, LOCATIONS, REGION_CONNECTIONS
@@ -18,6 +18,15 @@ from .rules import MessengerHardRules, MessengerOOBRules, MessengerRules
 from .shop import FIGURINES, PROG_SHOP_ITEMS, SHOP_ITEMS, USEFUL_SHOP_ITEMS, shuffle_shop_prices
 from .subclasses import MessengerEntrance, MessengerItem, MessengerRegion, MessengerShopLocation
 
+PROGRESSION_ITEMS: frozenset[str] = frozenset({*NOTES, *PROG_ITEMS, *PHOBEKINS, *PROG_SHOP_ITEMS})
+USEFUL_ITEM_NAMES: frozenset[str] = frozenset({*USEFUL_ITEMS, *USEFUL_SHOP_ITEMS})
+
+# MessengerOOBRules is intentionally not selectable through the logic option
+LOGIC_RULES: dict[int, type[MessengerRules]] = {
+    Logic.option_normal: MessengerRules,
+    Logic.option_hard: MessengerHardRules,
+}
+
 components.append(
     Component("The Messenger", component_type=Type.CLIENT, func=launch_game, game_name="The Messenger", supports_uri=True)
 )
@@ -224,8 +233,8 @@ class MessengerWorld(World):
                               self.options.total_seals.value)
             if total_seals < self.total_seals:
                 logging.warning(
-                    f"Not enough locations for total seals setting "
-                    f"({self.options.total_seals}). Adjusting to {total_seals}"
+                    "Not enough locations for total seals setting (%s). Adjusting to %s",
+                    self.options.total_seals, total_seals
                 )
                 self.total_seals = total_seals
             self.required_seals = int(self.options.percent_seals_required.value / 100 * self.total_seals)
@@ -247,14 +256,11 @@ class MessengerWorld(World):
 
     def set_rules(self) -> None:
         logic = self.options.logic_level
-        if logic == Logic.option_normal:
-            MessengerRules(self).set_messenger_rules()
-        elif logic == Logic.option_hard:
-            MessengerHardRules(self).set_messenger_rules()
-        else:
+        rules_class = LOGIC_RULES.get(logic.value)
+        if rules_class is None:
             raise ValueError(f"Somehow you have a logic option that's currently invalid."
                              f" {logic} for {self.multiworld.get_player_name(self.player)}")
-        #     MessengerOOBRules(self).set_messenger_rules()
+        rules_class(self).set_messenger_rules()
 
         add_closed_portal_reqs(self)
         # i need portal shuffle to happen after rules exist so i can validate it
@@ -325,8 +331,8 @@ class MessengerWorld(World):
         )
 
     def get_item_classification(self, name: str) -> ItemClassification:
-        if "Time Shard " in name:
-            count = int(name.strip("Time Shard ()"))
+        count = TIME_SHARDS.get(name)
+        if count is not None:
             count = count if count >= 100 else 0
             self.total_shards += count
             return ItemClassification.progression_skip_balancing if count else ItemClassification.filler
@@ -339,10 +345,10 @@ class MessengerWorld(World):
             return ItemClassification.progression_skip_balancing \
                 if self.required_seals >= self.created_seals else ItemClassification.filler
 
-        if name in {*NOTES, *PROG_ITEMS, *PHOBEKINS, *PROG_SHOP_ITEMS}:
+        if name in PROGRESSION_ITEMS:
             return ItemClassification.progression
 
-        if name in {*USEFUL_ITEMS, *USEFUL_SHOP_ITEMS}:
+        if name in USEFUL_ITEM_NAMES:
             return ItemClassification.useful
         
         if name in TRAPS:
@@ -363,14 +369,14 @@ class MessengerWorld(World):
 
     def collect(self, state: "CollectionState", item: "Item") -> bool:
         change = super().collect(state, item)
-        if change and "Time Shard" in item.name:
-            state.prog_items[self.player]["Shards"] += int(item.name.strip("Time Shard ()"))
+        if change and item.name in TIME_SHARDS:
+            state.prog_items[self.player]["Shards"] += TIME_SHARDS[item.name]
         return change
 
     def remove(self, state: "CollectionState", item: "Item") -> bool:
         change = super().remove(state, item)
-        if change and "Time Shard" in item.name:
-            state.prog_items[self.player]["Shards"] -= int(item.name.strip("Time Shard ()"))
+        if change and item.name in TIME_SHARDS:
+            state.prog_items[self.player]["Shards"] -= TIME_SHARDS[item.name]
         return change
 
     @classmethod
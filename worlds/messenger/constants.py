@@ -48,6 +48,16 @@ FILLER: dict[str, int] = {
     "Time Shard (500)": 5,
 }
 
+# number of shards each time shard item is worth
+TIME_SHARDS: dict[str, int] = {
+    "Time Shard": 1,
+    "Time Shard (10)": 10,
+    "Time Shard (50)": 50,
+    "Time Shard (100)": 100,
+    "Time Shard (300)": 300,
+    "Time Shard (500)": 500,
+}
+
 TRAPS: dict[str, int] = {
     "Teleport Trap": 5,
     "Prophecy Trap": 10,
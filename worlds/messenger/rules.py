@@ -8,6 +8,15 @@ from .options import MessengerAccessibility
 if TYPE_CHECKING:
     from . import MessengerWorld
 
+CORRUPTED_FUTURE_ITEMS = frozenset({"Demon King Crown", "Magic Firefly"})
+CRESTS = frozenset({"Sun Crest", "Moon Crest"})
+DBOOST_ITEMS = frozenset({"Path of Resilience", "Meditation"})
+DOUBLE_DBOOST_ITEMS = frozenset({"Path of Resilience", "Meditation", "Second Wind"})
+VERTICAL_ITEMS = frozenset({"Wingsuit", "Rope Dart"})
+AEROBATIC_ITEMS = frozenset({"Wingsuit", "Aerobatics Warrior"})
+OOB_SKYLANDS_ITEMS = frozenset({"Windmill Shuriken", "Wingsuit", "Rope Dart", "Magic Firefly"})
+OOB_FIREBALL_WAVE_ITEMS = frozenset({"Wingsuit", "Windmill Shuriken"})
+
 
 class MessengerRules:
     player: int
@@ -32,7 +41,7 @@ class MessengerRules:
         self.connection_rules = {
             # from ToTHQ
             "Artificer's Portal":
-                lambda state: state.has_all({"Demon King Crown", "Magic Firefly"}, self.player),
+                lambda state: state.has_all(CORRUPTED_FUTURE_ITEMS, self.player),
             "Shrink Down":
                 lambda state: state.has_all(NOTES, self.player) or self.has_enough_seals(state),
             # the shop
@@ -287,7 +296,7 @@ class MessengerRules:
                 lambda state: self.has_tabi(state) or self.has_dart(state),
             # sunken shrine
             "Sunken Shrine - Key of Love":
-                lambda state: state.has_all({"Sun Crest", "Moon Crest"}, self.player),
+                lambda state: state.has_all(CRESTS, self.player),
             "Sunken Shrine Seal - Waterfall Paradise":
                 self.has_tabi,
             "Sunken Shrine Seal - Tabi Gauntlet":
@@ -324,7 +333,7 @@ class MessengerRules:
         return state.has("Lightfoot Tabi", self.player)
 
     def has_vertical(self, state: CollectionState) -> bool:
-        return self.has_wingsuit(state) or self.has_dart(state)
+        return state.has_any(VERTICAL_ITEMS, self.player)
 
     def has_enough_seals(self, state: CollectionState) -> bool:
         return state.has("Power Seal", self.player, self.required_seals)
@@ -333,14 +342,14 @@ class MessengerRules:
         return state.has("Strike of the Ninja", self.player)
 
     def can_dboost(self, state: CollectionState) -> bool:
-        return state.has_any({"Path of Resilience", "Meditation"}, self.player) and \
+        return state.has_any(DBOOST_ITEMS, self.player) and \
             state.has("Second Wind", self.player)
 
     def can_double_dboost(self, state: CollectionState) -> bool:
-        return state.has_all({"Path of Resilience", "Meditation", "Second Wind"}, self.player)
+        return state.has_all(DOUBLE_DBOOST_ITEMS, self.player)
 
     def is_aerobatic(self, state: CollectionState) -> bool:
-        return self.has_wingsuit(state) and state.has("Aerobatics Warrior", self.player)
+        return state.has_all(AEROBATIC_ITEMS, self.player)
 
     def true(self, state: CollectionState) -> bool:
         """I know this is stupid, but it's easier to read in the dicts."""
@@ -499,26 +508,21 @@ class MessengerOOBRules(MessengerRules):
         self.required_seals = max(1, world.required_seals)
         self.region_rules = {
             "Elemental Skylands":
-                lambda state: state.has_any(
-                    {"Windmill Shuriken", "Wingsuit", "Rope Dart", "Magic Firefly"}, self.player
-                ),
-            "Music Box": lambda state: state.has_all(set(NOTES), self.player) or self.has_enough_seals(state),
+                lambda state: state.has_any(OOB_SKYLANDS_ITEMS, self.player),
+            "Music Box": lambda state: state.has_all(NOTES, self.player) or self.has_enough_seals(state),
         }
 
         self.location_rules = {
             "Bamboo Creek - Claustro": self.has_wingsuit,
             "Searing Crags - Key of Strength": self.has_wingsuit,
-            "Sunken Shrine - Key of Love": lambda state: state.has_all({"Sun Crest", "Moon Crest"}, self.player),
+            "Sunken Shrine - Key of Love": lambda state: state.has_all(CRESTS, self.player),
             "Searing Crags - Pyro": self.has_tabi,
             "Underworld - Key of Chaos": self.has_tabi,
             "Corrupted Future - Key of Courage":
-                lambda state: state.has_all({"Demon King Crown", "Magic Firefly"}, self.player),
+                lambda state: state.has_all(CORRUPTED_FUTURE_ITEMS, self.player),
             "Autumn Hills Seal - Spike Ball Darts": self.has_dart,
             "Ninja Village Seal - Tree House": self.has_dart,
-            "Underworld Seal - Fireball Wave": lambda state: state.has_any(
-                {"Wingsuit", "Windmill Shuriken"},
-                self.player
-            ),
+            "Underworld Seal - Fireball Wave": lambda state: state.has_any(OOB_FIREBALL_WAVE_ITEMS, self.player),
             "Tower of Time Seal - Time Waster": self.has_dart,
         }
 
@@ -70,7 +70,7 @@ class Rule_AST_Transformer(ast.NodeTransformer):
 
 
     def visit_Name(self, node):
-        if node.id in dir(self):
+        if hasattr(self, node.id):
             return getattr(self, node.id)(node)
         elif node.id in rule_aliases:
             args, repl = rule_aliases[node.id]
@@ -190,6 +190,24 @@ def create_shop_rule(location, parser):
     return parser.parse_rule('(Progressive_Wallet, %d)' % required_wallets(location.price))
 
 
+shop_wallet_items = frozenset({'Buy Arrows (50)', 'Buy Fish', 'Buy Goron Tunic', 'Buy Bombchu (20)', 'Buy Bombs (30)'})
+shop_wallet2_items = frozenset({'Buy Zora Tunic', 'Buy Blue Fire'})
+shop_adult_items = frozenset({'Buy Goron Tunic', 'Buy Zora Tunic'})
+shop_bottle_items = frozenset({
+    'Buy Blue Fire',
+    'Buy Blue Potion',
+    'Buy Bottle Bug',
+    'Buy Fish',
+    'Buy Green Potion',
+    'Buy Poe',
+    'Buy Red Potion [30]',
+    'Buy Red Potion [40]',
+    'Buy Red Potion [50]',
+    'Buy Fairy\'s Spirit',
+})
+shop_bombchu_items = frozenset({'Buy Bombchu (10)', 'Buy Bombchu (20)', 'Buy Bombchu (5)'})
+
+
 # This function should be run once after the shop items are placed in the world.
 # It should be run before other items are placed in the world so that logic has
 # the correct checks for them. This is safe to do since every shop is still
@@ -201,30 +219,25 @@ def set_shop_rules(ootworld):
     wallet = ootworld.parser.parse_rule('Progressive_Wallet')
     wallet2 = ootworld.parser.parse_rule('(Progressive_Wallet, 2)')
 
+    def has_bottle(state):
+        return CollectionState._oot_has_bottle(state, ootworld.player)
+
     for location in filter(lambda location: location.item and oot_is_item_of_type(location.item, 'Shop'), ootworld.get_locations()):
+        item_name = location.item.name
         # Add wallet requirements
-        if location.item.name in ['Buy Arrows (50)', 'Buy Fish', 'Buy Goron Tunic', 'Buy Bombchu (20)', 'Buy Bombs (30)']:
+        if item_name in shop_wallet_items:
             add_rule(location, wallet)
-        elif location.item.name in ['Buy Zora Tunic', 'Buy Blue Fire']:
+        elif item_name in shop_wallet2_items:
             add_rule(location, wallet2)
 
         # Add adult only checks
-        if location.item.name in ['Buy Goron Tunic', 'Buy Zora Tunic']:
+        if item_name in shop_adult_items:
             add_rule(location, ootworld.parser.parse_rule('is_adult', location))
 
         # Add item prerequisite checks
-        if location.item.name in ['Buy Blue Fire',
-                                  'Buy Blue Potion',
-                                  'Buy Bottle Bug',
-                                  'Buy Fish',
-                                  'Buy Green Potion',
-                                  'Buy Poe',
-                                  'Buy Red Potion [30]',
-                                  'Buy Red Potion [40]',
-                                  'Buy Red Potion [50]',
-                                  'Buy Fairy\'s Spirit']:
-            add_rule(location, lambda state: CollectionState._oot_has_bottle(state, ootworld.player))
-        if location.item.name in ['Buy Bombchu (10)', 'Buy Bombchu (20)', 'Buy Bombchu (5)']:
+        if item_name in shop_bottle_items:
+            add_rule(location, has_bottle)
+        if item_name in shop_bombchu_items:
             add_rule(location, found_bombchus)
 
 
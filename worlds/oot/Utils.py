@@ -11,13 +11,15 @@ def data_path(*args):
     return os.path.join(os.path.dirname(__file__), 'data', *args)
 
 
+json_comment_re = re.compile(r'#[^\n]*')
+json_spaces_re = re.compile(' +')
+
+
 @lru_cache
 def read_json(file_path):
-    json_string = ""
     with io.open(file_path, 'r') as file:
-        for line in file.readlines():
-            json_string += line.split('#')[0].replace('\n', ' ')
-    json_string = re.sub(' +', ' ', json_string)
+        json_string = json_comment_re.sub('', file.read()).replace('\n', ' ')
+    json_string = json_spaces_re.sub(' ', json_string)
     try:
         return json.loads(json_string)
     except json.JSONDecodeError as error:
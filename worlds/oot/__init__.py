@@ -1278,6 +1278,7 @@ class OOTWorld(World):
 
         if (self.shuffle_interior_entrances != 'off' or self.shuffle_dungeon_entrances
             or self.shuffle_grotto_entrances or self.shuffle_bosses != 'off'):
+            player_hint_data = er_hint_data[self.player]
             for region in self.regions:
                 if not any(bool(loc.address) for loc in region.locations): # check if region has any non-event locations
                     continue
@@ -1285,8 +1286,8 @@ class OOTWorld(World):
                 if main_entrance is not None and (main_entrance.shuffled or (region.is_boss_room and self.shuffle_bosses != 'off')):
                     for location in region.locations:
                         if type(location.address) == int:
-                            er_hint_data[self.player][location.address] = main_entrance.name
-                            logger.debug(f"Set {location.name} hint data to {main_entrance.name}")
+                            player_hint_data[location.address] = main_entrance.name
+                            logger.debug('Set %s hint data to %s', location.name, main_entrance.name)
 
 
     def write_spoiler(self, spoiler_handle: typing.TextIO) -> None: